@@ -1,9 +1,16 @@
 # app.py
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import hashlib
 import json
+import mmap
 import random
+import re
+import sys
+import orjson
 from typing import List, Dict, Any
 
 DATA_FILENAME = "emoji_data.json"
@@ -25,41 +32,53 @@ app.add_middleware(
 # In-memory store of full records loaded from JSON.
 # Each record will have keys: unicode_seq (str), emoji (computed str), movie_name (str), hint (str)
 _EMOJI_ITEMS: List[Dict[str, Any]] = []
+# _EMOJI_ITEMS serialized once at load time; served verbatim by the root endpoint.
+_EMOJI_ITEMS_JSON: bytes = b"[]"
+# Strong validator for _EMOJI_ITEMS_JSON, so repeat clients can revalidate with If-None-Match.
+_EMOJI_ITEMS_ETAG: str = ""
 
 
+class StaticResponse(Response):
+    """
+    A Response that is built once and sent many times.
+    Middleware (e.g. CORS) edits the header list it is handed, so each send gets a copy.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": list(self.raw_headers)})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+# Stands in as the only "record" for the plain-text endpoints until data is loaded (or
+# when none could be), so they never need an emptiness check. Same body as ensure_items()'s 404.
+_NOT_FOUND_RESPONSE = StaticResponse(
+    content=orjson.dumps({"detail": "No emoji mappings available"}),
+    status_code=404,
+    media_type="application/json",
+)
+
+# Ready-made plain-text responses for /emoji, /movie and /hint, one per record, so
+# the request path is one random.choice over a list, with no dict lookup, encode or header build.
+_EMOJI_RESPONSES: List[Response] = [_NOT_FOUND_RESPONSE]
+_MOVIE_RESPONSES: List[Response] = [_NOT_FOUND_RESPONSE]
+_HINT_RESPONSES: List[Response] = [_NOT_FOUND_RESPONSE]
+
+
+# One codepoint per run of hex digits. Non-hex characters (the U+ and \u prefixes, spaces,
+# stray punctuation) only separate runs; a 0x prefix is consumed so its 0 isn't read as U+0000.
+_TOKEN_RE = re.compile(r"(?:0[xX])?([0-9A-Fa-f]+)")
+
+
+@lru_cache(maxsize=8192)
 def unicode_seq_to_emoji(seq: str) -> str:
     """
-    Convert a sequence like "U+1F680 U+1F315" or "1F680 1F315"
+    Convert a sequence like "U+1F680 U+1F315", "\\u1F680", "0x1F680" or "1F680 1F315"
     into the corresponding emoji characters string.
-    Handles spaces between codepoints and ignores empty tokens.
-    """
-    if not seq or not isinstance(seq, str):
-        return ""
-    parts = seq.split()
-    chars: List[str] = []
-    for token in parts:
-        token = token.strip()
-        if not token:
-            continue
-        # allow formats: U+1F680 or 1F680 or \u1F680
-        if token.upper().startswith("U+"):
-            hexpart = token[2:]
-        elif token.startswith("\\u") or token.startswith("\\U"):
-            hexpart = token.lstrip("\\u").lstrip("\\U")
-        else:
-            hexpart = token
-        # Remove potential non-hex characters
-        hexpart = "".join(
-            ch for ch in hexpart if ch in "0123456789abcdefABCDEF")
-        if not hexpart:
-            continue
-        try:
-            codepoint = int(hexpart, 16)
-            chars.append(chr(codepoint))
-        except Exception:
-            # skip invalid codepoints silently
-            continue
-    return "".join(chars)
+    Results are cached; callers must pass a str.
+    """
+    codepoints = (int(hexpart, 16) for hexpart in _TOKEN_RE.findall(seq))
+    # skip codepoints beyond U+10FFFF silently
+    return "".join(chr(cp) for cp in codepoints if cp <= sys.maxunicode)
 
 
 def load_data_from_file() -> None:
@@ -68,17 +87,31 @@ def load_data_from_file() -> None:
       - unicode_seq (string containing U+.... tokens or hex codepoints)
       - movie_name (string)
       - hint (string or omitted)
-    The function computes the runtime 'emoji' field from unicode_seq and stores everything in _EMOJI_ITEMS.
+    The function computes the runtime 'emoji' field from unicode_seq and stores everything in _EMOJI_ITEMS,
+    plus the prebuilt emoji/movie_name/hint responses used by the plain-text endpoints.
     """
-    global _EMOJI_ITEMS
+    global _EMOJI_ITEMS, _EMOJI_ITEMS_JSON, _EMOJI_ITEMS_ETAG, _EMOJI_RESPONSES, _MOVIE_RESPONSES, _HINT_RESPONSES
     base = Path(__file__).resolve().parent
     data_path = base / DATA_FILENAME
     try:
-        text = data_path.read_text(encoding="utf-8")
-        loaded = json.loads(text)
-        if not isinstance(loaded, list):
-            raise ValueError("JSON root must be a list")
+        # Parse the mapped file bytes directly: no str decode copy, no read() buffer.
+        # A non-list root simply yields no usable records below.
+        with open(data_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    try:
+                        loaded = orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        # orjson rejects lone-surrogate escapes ("\ud800") that json accepts;
+                        # fall back so only the affected records get skipped below.
+                        loaded = json.loads(bytes(view))
         items: List[Dict[str, Any]] = []
+        items_json: List[bytes] = []
+        emojis: List[Response] = []
+        movies: List[Response] = []
+        hints: List[Response] = []
+        # Repeated values (shared hints, remakes, empty strings) share one str and one Response.
+        plain: Dict[str, Response] = {}
         for obj in loaded:
             if not isinstance(obj, dict):
                 continue
@@ -89,22 +122,51 @@ def load_data_from_file() -> None:
             if not seq or not movie_val:
                 # skip records missing required fields
                 continue
-            emoji_chars = unicode_seq_to_emoji(seq)
-            items.append({
+            emoji_chars = unicode_seq_to_emoji(seq) if isinstance(seq, str) else ""
+            if hint_val is None:
+                hint_val = ""
+            if isinstance(movie_val, str):
+                movie_val = sys.intern(movie_val)
+            if isinstance(hint_val, str):
+                hint_val = sys.intern(hint_val)
+            record = {
                 "unicode_seq": seq,
                 "emoji": emoji_chars,
                 "movie_name": movie_val,
-                "hint": hint_val if hint_val is not None else ""
-            })
+                "hint": hint_val
+            }
+            try:
+                record_json = orjson.dumps(record)
+                emoji_resp, movie_resp, hint_resp = (
+                    plain.get(text) or plain.setdefault(text, as_plain_text(text))
+                    for text in (emoji_chars, str(movie_val), str(hint_val or ""))
+                )
+            except (UnicodeEncodeError, orjson.JSONEncodeError):
+                # skip records whose text can't be encoded as UTF-8 (e.g. lone surrogates)
+                continue
+            items.append(record)
+            items_json.append(record_json)
+            emojis.append(emoji_resp)
+            movies.append(movie_resp)
+            hints.append(hint_resp)
         _EMOJI_ITEMS = items
+        _EMOJI_ITEMS_JSON = b"[" + b",".join(items_json) + b"]"
+        _EMOJI_ITEMS_ETAG = '"' + hashlib.sha1(_EMOJI_ITEMS_JSON).hexdigest() + '"'
+        if not items:
+            emojis = movies = hints = [_NOT_FOUND_RESPONSE]
+        _EMOJI_RESPONSES, _MOVIE_RESPONSES, _HINT_RESPONSES = emojis, movies, hints
     except Exception:
         # If file missing or corrupt, make empty list so endpoints return 404
         _EMOJI_ITEMS = []
+        _EMOJI_ITEMS_JSON = b"[]"
+        _EMOJI_ITEMS_ETAG = ""
+        _EMOJI_RESPONSES = _MOVIE_RESPONSES = _HINT_RESPONSES = [_NOT_FOUND_RESPONSE]
 
 
 @app.on_event("startup")
-def startup_event():
-    load_data_from_file()
+async def startup_event():
+    # File read and parse run in a worker thread so the event loop stays free meanwhile.
+    await asyncio.to_thread(load_data_from_file)
 
 
 # -----------------------
@@ -118,21 +180,35 @@ def ensure_items():
             status_code=404, detail="No emoji mappings available")
 
 
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header value against our ETag (RFC 9110 13.1.2).
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 def as_plain_text(content: str) -> Response:
-    return Response(content=content, media_type="text/plain; charset=utf-8")
+    return StaticResponse(content=content, media_type="text/plain; charset=utf-8")
 
 
 # -----------------------
 # Root endpoint: return full processed JSON
 # -----------------------
 @app.get("/", summary="Return all processed entries from emoji_data.json")
-def root_all():
+async def root_all(request: Request):
     """
     Returns the entire list loaded from emoji_data.json (including computed 'emoji' field).
+    Answers 304 Not Modified when the client's If-None-Match matches the current ETag.
     Visit this URL in your browser: http://localhost:8000/
     """
     ensure_items()
-    return _EMOJI_ITEMS
+    headers = {"ETag": _EMOJI_ITEMS_ETAG, "Cache-Control": "public, max-age=60"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, _EMOJI_ITEMS_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_EMOJI_ITEMS_JSON, media_type="application/json", headers=headers)
 
 
 # -----------------------
@@ -140,30 +216,24 @@ def root_all():
 # -----------------------
 
 @app.get("/emoji", summary="Get one random emoji")
-def random_emoji():
+async def random_emoji():
     """
     Return one random emoji (plain text), e.g.: 🚀🌕
     """
-    ensure_items()
-    value = random.choice(_EMOJI_ITEMS)["emoji"]
-    return as_plain_text(value)
+    return random.choice(_EMOJI_RESPONSES)
 
 
 @app.get("/movie", summary="Get one random movie name")
-def random_movie():
+async def random_movie():
     """
     Return one random movie name (plain text), e.g.: "Sherlock Holmes"
     """
-    ensure_items()
-    value = random.choice(_EMOJI_ITEMS)["movie_name"]
-    return as_plain_text(value)
+    return random.choice(_MOVIE_RESPONSES)
 
 
 @app.get("/hint", summary="Get one random hint")
-def random_hint():
+async def random_hint():
     """
     Return one random hint (plain text), may be empty if not provided.
     """
-    ensure_items()
-    value = random.choice(_EMOJI_ITEMS)["hint"] or ""
-    return as_plain_text(value)
+    return random.choice(_HINT_RESPONSES)